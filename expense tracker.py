@@ -20,36 +20,100 @@ Usage:
 Dependencies:
 - Python 3.8+
 - tkinter (built-in)
-- sqlite3 (built-in)
-- matplotlib (pip install matplotlib)
+- sqlite3 (built-in); the linked SQLite library must be 3.15+ (row-value
+  comparisons page the table), and 3.31+ enables the indexed monthly summary
+- matplotlib (pip install matplotlib; pulls in numpy, used for the chart data)
 - pandas (optional for CSV export; but built-in csv module is used here)
 """
 
 import sqlite3
 import datetime
+import re
+import concurrent.futures
+import functools
+import itertools
+import threading
+import collections
+import queue
 import csv
 import os
 from tkinter import *
 from tkinter import ttk, messagebox, filedialog
 from tkinter.simpledialog import askstring
 
-# Optional import for plotting
-try:
-    import matplotlib.pyplot as plt
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-    MATPLOTLIB_AVAILABLE = True
-except Exception:
-    MATPLOTLIB_AVAILABLE = False
-
 DB_FILE = "expenses.db"
 
+# Shared connection, opened once by init_db() and reused by every helper.
+APP_CONN = None
+
+# Memoized summaries (least recently used first) and the write generation
+# they were computed under; see _memoize_until_write().
+_SUMMARY_CACHE = collections.OrderedDict()
+_SUMMARY_CACHE_SIZE = 32
+_GENERATION = 0
+_CACHE_LOCK = threading.Lock()
+
 
 # ---------------------------
 # Database utilities
 # ---------------------------
+def _where_clause(has_start, has_end, has_category):
+    return (" WHERE 1=1"
+            + (" AND date >= ?" if has_start else "")
+            + (" AND date <= ?" if has_end else "")
+            + (" AND category = ?" if has_category else ""))
+
+
+def _filter_args(start_date=None, end_date=None, category=None):
+    """Map a filter to its (has_start, has_end, has_category) key and bound params."""
+    category = category.strip() if category else None
+    key = (bool(start_date), bool(end_date), bool(category))
+    params = [value for value in (start_date, end_date, category) if value]
+    return key, params
+
+
+# Every filter shape is built once here, so a query is a dict lookup and the
+# SQL text stays identical between calls (sqlite3 caches statements by text).
+_FILTER_KEYS = [(s, e, c) for s in (False, True) for e in (False, True) for c in (False, True)]
+SQL_EXPENSES = {
+    key + (has_after,): "SELECT id, date, category, amount, note FROM expenses" + _where_clause(*key)
+                        + (" AND (date, id) < (?, ?)" if has_after else "")
+                        + " ORDER BY date DESC, id DESC LIMIT ? OFFSET ?"
+    for key in _FILTER_KEYS for has_after in (False, True)
+}
+SQL_EXPENSES_COUNT = {
+    key: "SELECT COUNT(*) FROM expenses" + _where_clause(*key)
+    for key in _FILTER_KEYS
+}
+# Any date bound is pinned to the covering (date, category, amount) index; left
+# to itself the planner full-scans (category, amount) for one-sided ranges.
+SQL_CATEGORY_SUMMARY = {
+    (s, e): "SELECT category, SUM(amount) FROM expenses"
+            + (" INDEXED BY idx_expenses_date_cat_amt" if s or e else "")
+            + _where_clause(s, e, False)
+            + " GROUP BY category ORDER BY SUM(amount) DESC"
+    for s in (False, True) for e in (False, True)
+}
+
+# Generated columns need SQLite 3.31+. Older builds keep grouping on SUBSTR(date),
+# which scans the covering (date, category, amount) index, and their schema is
+# left untouched so the database file stays readable by them.
+HAS_GENERATED_COLUMNS = sqlite3.sqlite_version_info >= (3, 31, 0)
+SQL_MONTHLY_SUMMARY = (
+    "SELECT month, SUM(amount) FROM expenses GROUP BY month ORDER BY month DESC"
+    if HAS_GENERATED_COLUMNS else
+    "SELECT SUBSTR(date, 1, 7) AS month, SUM(amount) FROM expenses GROUP BY month ORDER BY month DESC"
+)
+
+
 def init_db():
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
+    global APP_CONN
+    APP_CONN = sqlite3.connect(DB_FILE, check_same_thread=False, isolation_level=None)
+    cursor = APP_CONN.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-20000")
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS expenses (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -59,99 +123,373 @@ def init_db():
             note TEXT
         )
     """)
-    conn.commit()
-    conn.close()
+    # Year-month derived from date, so the monthly summary can group on an index.
+    # VIRTUAL because SQLite cannot ADD a STORED column to a table that has rows.
+    if HAS_GENERATED_COLUMNS:
+        columns = [row[1] for row in cursor.execute("PRAGMA table_xinfo(expenses)")]
+        if "month" not in columns:
+            cursor.execute("ALTER TABLE expenses ADD COLUMN month TEXT GENERATED ALWAYS AS (substr(date, 1, 7)) VIRTUAL")
+        # Covering (month, amount), so the summary never visits the table; it
+        # replaces the earlier month-only index on databases that have it
+        cursor.execute("DROP INDEX IF EXISTS idx_expenses_month")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_expenses_month_amt ON expenses(month, amount)")
+    # Filters always constrain on date, optionally narrowed by category
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_expenses_date ON expenses(date)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_expenses_cat_date ON expenses(category, date)")
+    # Covering indexes for the category summary: (category, amount) unfiltered,
+    # (date, category, amount) for any date bound (pinned in SQL_CATEGORY_SUMMARY)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_expenses_cat_amt ON expenses(category, amount)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_expenses_date_cat_amt ON expenses(date, category, amount)")
+    _warm_statements()
+
+
+def _warm_statements():
+    """Compile the paged row queries once so later calls hit sqlite3's statement cache.
+
+    Each runs with LIMIT 0, which SQLite checks before reading any row, so
+    this costs only the parse and plan. Counts and summaries are left to
+    compile on first use: executing an aggregate can scan whatever the plan
+    picks, even with its filters bound to NULL.
+    """
+    cursor = APP_CONN.cursor()
+    for sql in SQL_EXPENSES.values():
+        params = [None] * (sql.count("?") - 2) + [0, 0]
+        cursor.execute(sql, params).fetchone()
+
+
+def close_db():
+    global APP_CONN
+    if APP_CONN is not None:
+        APP_CONN.close()
+        APP_CONN = None
+    _bump_version()
+
+
+def insert_expenses_bulk(rows):
+    """Insert (date, category, amount, note) tuples in a single transaction.
+
+    Returns the id of the last row inserted.
+    """
+    cursor = APP_CONN.cursor()
+    cursor.execute("BEGIN")
+    try:
+        cursor.executemany(
+            "INSERT INTO expenses (date, category, amount, note) VALUES (?, ?, ?, ?)",
+            rows,
+        )
+        # executemany leaves cursor.lastrowid unset, so ask the connection
+        last_id = cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+    except Exception:
+        cursor.execute("ROLLBACK")
+        raise
+    cursor.execute("COMMIT")
+    _bump_version()
+    return last_id
 
 
 def insert_expense(date, category, amount, note):
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    cursor.execute(
-        "INSERT INTO expenses (date, category, amount, note) VALUES (?, ?, ?, ?)",
-        (date, category, amount, note),
-    )
-    conn.commit()
-    conn.close()
+    return insert_expenses_bulk([(date, category, amount, note)])
 
 
 def update_expense(record_id, date, category, amount, note):
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
+    # Connection is in autocommit mode, so a single statement is its own transaction
+    cursor = APP_CONN.cursor()
     cursor.execute(
         "UPDATE expenses SET date = ?, category = ?, amount = ?, note = ? WHERE id = ?",
         (date, category, amount, note, record_id),
     )
-    conn.commit()
-    conn.close()
+    _bump_version()
 
 
 def delete_expense(record_id):
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
+    cursor = APP_CONN.cursor()
     cursor.execute("DELETE FROM expenses WHERE id = ?", (record_id,))
-    conn.commit()
-    conn.close()
-
-
-def fetch_expenses(start_date=None, end_date=None, category=None):
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    query = "SELECT id, date, category, amount, note FROM expenses WHERE 1=1"
-    params = []
-    if start_date:
-        query += " AND date >= ?"
-        params.append(start_date)
-    if end_date:
-        query += " AND date <= ?"
-        params.append(end_date)
-    if category and category.strip():
-        query += " AND category = ?"
-        params.append(category.strip())
-    query += " ORDER BY date DESC"
-    cursor.execute(query, params)
-    rows = cursor.fetchall()
-    conn.close()
-    return rows
+    _bump_version()
 
 
+def _bump_version():
+    # Summaries are memoized until the data changes; this module is the only writer
+    global _GENERATION
+    with _CACHE_LOCK:
+        _GENERATION += 1
+        _SUMMARY_CACHE.clear()
+
+
+def _memoize_until_write(func):
+    """Cache func's result per arguments until the next write.
+
+    Like lru_cache, the cache holds _SUMMARY_CACHE_SIZE entries and evicts
+    the least recently used one. Summaries run on the worker thread while
+    writes run on the Tk thread, so a query can overlap a write; a result is
+    only stored if no write happened between starting the query and
+    finishing it.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = (func.__name__, args, tuple(sorted(kwargs.items())))
+        with _CACHE_LOCK:
+            if key in _SUMMARY_CACHE:
+                _SUMMARY_CACHE.move_to_end(key)
+                return _SUMMARY_CACHE[key]
+            generation = _GENERATION
+        result = func(*args, **kwargs)
+        with _CACHE_LOCK:
+            if generation == _GENERATION:
+                _SUMMARY_CACHE[key] = result
+                if len(_SUMMARY_CACHE) > _SUMMARY_CACHE_SIZE:
+                    _SUMMARY_CACHE.popitem(last=False)
+        return result
+    return wrapper
+
+
+def iter_expenses(start_date=None, end_date=None, category=None, limit=None, offset=0, after=None):
+    """Return a cursor over the matching rows; rows are pulled lazily as it is iterated.
+
+    Rows are ordered newest first. ``after`` is a (date, id) pair: only rows
+    sorting after it are returned, which lets the next page be found through
+    the date index instead of skipping ``offset`` rows.
+    """
+    key, params = _filter_args(start_date, end_date, category)
+    if after is not None:
+        params += [after[0], after[1]]
+    # A negative LIMIT means no limit to SQLite
+    params += [-1 if limit is None else limit, offset]
+    cursor = APP_CONN.cursor()
+    cursor.execute(SQL_EXPENSES[key + (after is not None,)], params)
+    return cursor
+
+
+def fetch_expenses(start_date=None, end_date=None, category=None, limit=None, offset=0, after=None):
+    return iter_expenses(start_date, end_date, category, limit, offset, after).fetchall()
+
+
+def count_expenses(start_date=None, end_date=None, category=None):
+    key, params = _filter_args(start_date, end_date, category)
+    cursor = APP_CONN.cursor()
+    cursor.execute(SQL_EXPENSES_COUNT[key], params)
+    return cursor.fetchone()[0]
+
+
+@_memoize_until_write
 def fetch_category_summary(start_date=None, end_date=None):
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    query = "SELECT category, SUM(amount) FROM expenses WHERE 1=1"
-    params = []
-    if start_date:
-        query += " AND date >= ?"
-        params.append(start_date)
-    if end_date:
-        query += " AND date <= ?"
-        params.append(end_date)
-    query += " GROUP BY category ORDER BY SUM(amount) DESC"
-    cursor.execute(query, params)
-    rows = cursor.fetchall()
-    conn.close()
-    return rows
+    key, params = _filter_args(start_date, end_date)
+    cursor = APP_CONN.cursor()
+    cursor.execute(SQL_CATEGORY_SUMMARY[key[:2]], params)
+    # Tuple, since the cached result is shared between callers
+    return tuple(cursor.fetchall())
 
 
+@_memoize_until_write
 def fetch_monthly_summary():
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    # Group by year-month
-    query = """
-        SELECT SUBSTR(date,1,7) AS month, SUM(amount) 
-        FROM expenses
-        GROUP BY month
-        ORDER BY month DESC
+    cursor = APP_CONN.cursor()
+    # Group by year-month; see HAS_GENERATED_COLUMNS
+    cursor.execute(SQL_MONTHLY_SUMMARY)
+    return tuple(cursor.fetchall())
+
+
+# ---------------------------
+# Helpers
+# ---------------------------
+_DATE_RE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})")
+
+
+def _valid_date(s):
+    """Check s is a real YYYY-MM-DD date without going through strptime."""
+    m = _DATE_RE.fullmatch(s)
+    if not m:
+        return False
+    try:
+        datetime.date(int(m[1]), int(m[2]), int(m[3]))
+    except ValueError:
+        return False
+    return True
+
+
+def _batched(iterable, n):
+    """Yield lists of up to n items from iterable."""
+    it = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(it, n))
+        if not chunk:
+            return
+        yield chunk
+
+
+# ---------------------------
+# Widgets
+# ---------------------------
+class LazyTable:
+    """Treeview wrapper that only keeps a window of rows as Tk items.
+
+    Rows are pulled a WINDOW at a time from ``fetch(limit, offset, after)``
+    and ``total`` sizes the scrollbar, so neither the widget nor Python holds
+    the whole result set. The window is re-fetched whenever the view nears
+    its edge; scrolling forward seeks from the last row already loaded.
     """
-    cursor.execute(query)
-    rows = cursor.fetchall()
-    conn.close()
-    return rows
+
+    WINDOW = 200
+
+    def __init__(self, tree, scrollbar):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.fetch = None
+        self.total = 0
+        # Materialized rows, starting at index `first` of the full result set
+        self.rows = []
+        self._index = {}
+        self.first = 0
+        self._offset = 0
+        self._next_first = 0
+        self._pending = None
+        # Renders whose own <<TreeviewSelect>> events may still be queued
+        self._restoring = 0
+        scrollbar.configure(command=self.on_scroll)
+        tree.configure(yscrollcommand=self._on_yview)
+
+    def set_source(self, total, fetch, rows):
+        """Show a result set of `total` rows whose first window is `rows`."""
+        self.total = total
+        self.fetch = fetch
+        self.first = 0
+        self._offset = 0
+        if self._pending is not None:
+            self.tree.after_cancel(self._pending)
+            self._pending = None
+        self._render(rows)
+
+    def row(self, iid):
+        return self.rows[self._index[iid]]
+
+    @property
+    def restoring(self):
+        """True while selection events from a re-render are being delivered."""
+        return self._restoring > 0
+
+    def _end_restore(self):
+        self._restoring -= 1
+
+    def add_row(self, row):
+        """Account for a newly inserted row, showing it if it sorts into the window."""
+        self.total += 1
+        key = (row[1], row[0])
+        pos = next((i for i, r in enumerate(self.rows) if (r[1], r[0]) < key), len(self.rows))
+        if pos == 0 and self.first > 0:
+            # Sorts ahead of the window, which just moves down by one
+            self.first += 1
+            return
+        if pos == len(self.rows) and self.first + len(self.rows) < self.total - 1:
+            # Sorts into rows past the window that are not loaded
+            return
+        self.rows.insert(pos, row)
+        self.tree.insert("", pos, iid=str(row[0]), values=row)
+        self._reindex()
+
+    def replace_row(self, row):
+        iid = str(row[0])
+        idx = self._index.get(iid)
+        if idx is not None and self.rows[idx][1] == row[1]:
+            # Same sort position, so the item can be patched in place
+            self.rows[idx] = row
+            self.tree.item(iid, values=row)
+            return
+        self.remove_row(iid)
+        self.add_row(row)
+
+    def remove_row(self, iid):
+        idx = self._index.get(iid)
+        if idx is None:
+            return
+        del self.rows[idx]
+        self.tree.delete(iid)
+        self.total -= 1
+        self._reindex()
+
+    def _reindex(self):
+        self._index = {str(row[0]): i for i, row in enumerate(self.rows)}
+
+    def on_scroll(self, *args):
+        # Scrollbar command: ("moveto", fraction) or ("scroll", n, "units"/"pages")
+        if args[0] != "moveto":
+            self.tree.yview(*args)
+            return
+        if not self.total:
+            return
+        target = int(float(args[1]) * self.total)
+        if self.first <= target < self.first + len(self.rows):
+            # Already materialized; _on_yview re-fetches if this lands on an edge
+            self.tree.yview_moveto((target - self.first) / len(self.rows))
+        else:
+            self._goto(target)
+
+    def _on_yview(self, lo, hi):
+        # Treeview reports its position inside the window; map it onto the full set
+        lo, hi = float(lo), float(hi)
+        shown = len(self.rows)
+        if not self.total or not shown:
+            self.scrollbar.set(0.0, 1.0)
+            return
+        lo_row = self.first + lo * shown
+        self.scrollbar.set(lo_row / self.total, (self.first + hi * shown) / self.total)
+        if self._pending is not None:
+            return
+        at_top = lo <= 0.0 and self.first > 0
+        at_bottom = hi >= 1.0 and self.first + shown < self.total
+        if at_top or at_bottom:
+            self._goto(int(lo_row))
+
+    def _goto(self, target):
+        # Centre the window on target; fetch once the pending scroll events settle
+        self._next_first = max(0, min(target - self.WINDOW // 2, self.total - self.WINDOW))
+        self._offset = target - self._next_first
+        if self._pending is None:
+            self._pending = self.tree.after_idle(self._refetch)
+
+    def _refetch(self):
+        self._pending = None
+        first = self._next_first
+        self._render(self._load(first), first)
+
+    def _load(self, first):
+        loaded_end = self.first + len(self.rows)
+        if self.first < first <= loaded_end:
+            # Seek past the row just before `first`, which is already in hand
+            anchor = self.rows[first - self.first - 1]
+            return self.fetch(self.WINDOW, 0, (anchor[1], anchor[0]))
+        return self.fetch(self.WINDOW, first)
+
+    def _render(self, rows, first=0):
+        self.first = first
+        self.rows = rows
+        self._reindex()
+        tree = self.tree
+        selected = tree.selection()
+        if selected:
+            # Replacing the items re-fires <<TreeviewSelect>> for a selection the
+            # user did not change. Those events are queued, so stay flagged until
+            # idle, which Tk only reaches after delivering them.
+            self._restoring += 1
+            tree.after_idle(self._end_restore)
+        children = tree.get_children()
+        if children:
+            tree.delete(*children)
+        # Bind the method once; supplying the iid spares Tk generating one
+        insert = tree.insert
+        for row in rows:
+            insert("", END, iid=str(row[0]), values=row)
+        kept = [iid for iid in selected if iid in self._index]
+        if kept:
+            tree.selection_set(kept)
+        if rows:
+            tree.yview_moveto(self._offset / len(rows))
 
 
 # ---------------------------
 # GUI / App logic
 # ---------------------------
 class ExpenseTrackerApp:
+    # How often the Tk thread checks for finished worker queries
+    POLL_MS = 20
+
     def __init__(self, root):
         self.root = root
         root.title("Expense Tracker")
@@ -223,10 +561,10 @@ class ExpenseTrackerApp:
         self.tree.pack(side=LEFT, fill=BOTH, expand=True)
         self.tree.bind("<<TreeviewSelect>>", self.on_select)
 
-        # Vertical scrollbar
-        vsb = ttk.Scrollbar(self.table_frame, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=vsb.set)
+        # Vertical scrollbar, driven by the lazy table rather than the Treeview
+        vsb = ttk.Scrollbar(self.table_frame, orient="vertical")
         vsb.pack(side=RIGHT, fill=Y)
+        self.table = LazyTable(self.tree, vsb)
 
         # Bottom controls (summary / chart / export)
         self.bottom_frame = Frame(root, pady=6)
@@ -237,6 +575,23 @@ class ExpenseTrackerApp:
         Button(self.bottom_frame, text="Export CSV (Filtered)", command=self.export_csv).grid(row=0, column=3, padx=6)
         Button(self.bottom_frame, text="Add Category Quick", command=self.quick_add_category).grid(row=0, column=4, padx=6)
 
+        # Queries run on a single worker so a slow one never blocks the Tk loop;
+        # one thread keeps them in submission order on the shared connection.
+        self._exec = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        # Finished queries wait here for the Tk thread; the worker never touches Tk
+        self._results = queue.Queue()
+        self._poll_results()
+
+        # (pyplot, FigureCanvasTkAgg, numpy), imported on the first plot
+        self._mpl = None
+
+        # Tcl scripts that read a whole group of fields at once; see _read_fields
+        self._form_fields = self._fields_script(self.date_var, self.category_var, self.amount_var, self.note_var)
+        self._filter_fields = self._fields_script(self.filter_start, self.filter_end, self.filter_category)
+
+        # Active (start, end, category) filter, re-run by export_csv
+        self.current_filter = (None, None, None)
+
         # Load initial data
         self.load_all_records()
 
@@ -244,50 +599,50 @@ class ExpenseTrackerApp:
     # CRUD Handlers
     # -----------------------
     def add_record(self):
-        date = self.date_var.get().strip()
-        category = self.category_var.get().strip()
-        amount = self.amount_var.get().strip()
-        note = self.note_var.get().strip()
+        date, category, amount, note = self._read_fields(self._form_fields)
 
         # Basic validation
         if not date or not category or not amount:
             messagebox.showerror("Required", "Date, Category and Amount are required.")
             return
         try:
-            # Check date format
-            datetime.datetime.strptime(date, "%Y-%m-%d")
             amt = float(amount)
         except ValueError:
+            amt = None
+        # Check date format
+        if amt is None or not _valid_date(date):
             messagebox.showerror("Invalid", "Date must be YYYY-MM-DD and amount must be a number.")
             return
 
-        insert_expense(date, category, amt, note)
+        record_id = insert_expenses_bulk([(date, category, amt, note)])
         messagebox.showinfo("Added", "Expense added successfully.")
         self.clear_inputs()
-        self.load_all_records()
+        self._row_added((record_id, date, category, amt, note))
 
     def update_record(self):
         selected = self.tree.selection()
         if not selected:
             messagebox.showwarning("Select", "Select a record to update.")
             return
-        record_id = self.tree.item(selected[0])["values"][0]
-        date = self.date_var.get().strip()
-        category = self.category_var.get().strip()
-        amount = self.amount_var.get().strip()
-        note = self.note_var.get().strip()
+        record_id = self._cached_row(selected[0])[0]
+        date, category, amount, note = self._read_fields(self._form_fields)
         if not date or not category or not amount:
             messagebox.showerror("Required", "Date, Category and Amount are required.")
             return
         try:
-            datetime.datetime.strptime(date, "%Y-%m-%d")
             amt = float(amount)
         except ValueError:
+            amt = None
+        if amt is None or not _valid_date(date):
             messagebox.showerror("Invalid", "Date must be YYYY-MM-DD and amount must be a number.")
             return
         update_expense(record_id, date, category, amt, note)
         messagebox.showinfo("Updated", "Record updated.")
-        self.load_all_records()
+        row = (record_id, date, category, amt, note)
+        if self._matches_filter(row):
+            self.table.replace_row(row)
+        else:
+            self.table.remove_row(str(record_id))
 
     def delete_record(self):
         selected = self.tree.selection()
@@ -296,10 +651,10 @@ class ExpenseTrackerApp:
             return
         if not messagebox.askyesno("Confirm", "Delete selected record?"):
             return
-        record_id = self.tree.item(selected[0])["values"][0]
+        record_id = self._cached_row(selected[0])[0]
         delete_expense(record_id)
         messagebox.showinfo("Deleted", "Record deleted.")
-        self.load_all_records()
+        self.table.remove_row(str(record_id))
 
     # -----------------------
     # Utility / UI
@@ -310,22 +665,51 @@ class ExpenseTrackerApp:
         self.amount_var.set("")
         self.note_var.set("")
 
+    @staticmethod
+    def _fields_script(*variables):
+        return "list " + " ".join(f"[set {var}]" for var in variables)
+
+    def _read_fields(self, script):
+        """Return the stripped values of a group of StringVars from one Tcl call."""
+        tk = self.root.tk
+        return [value.strip() for value in tk.splitlist(tk.eval(script))]
+
     def load_all_records(self):
         # No filters by default
-        self.populate_table(fetch_expenses())
+        self.populate_table()
 
-    def populate_table(self, rows):
-        # Clear
-        for r in self.tree.get_children():
-            self.tree.delete(r)
-        for row in rows:
-            self.tree.insert("", END, values=row)
+    def populate_table(self, start=None, end=None, category=None):
+        """Point the table at a filter; the count and first page load on the worker."""
+        self.current_filter = (start, end, category)
+        fetch = functools.partial(fetch_expenses, start, end, category)
+
+        def first_page():
+            return count_expenses(start, end, category), fetch(LazyTable.WINDOW)
+
+        self._submit(first_page, then=lambda page: self.table.set_source(page[0], fetch, page[1]))
+
+    def _matches_filter(self, row):
+        start, end, category = self.current_filter
+        return ((not start or row[1] >= start)
+                and (not end or row[1] <= end)
+                and (not category or row[2] == category))
+
+    def _row_added(self, row):
+        # Edits touch one Treeview item instead of reloading the table
+        if self._matches_filter(row):
+            self.table.add_row(row)
+
+    def _cached_row(self, iid):
+        # Rows are read back from the table's window rather than through tree.item()
+        return self.table.row(iid)
 
     def on_select(self, event):
         sel = self.tree.selection()
-        if not sel:
+        if not sel or self.table.restoring:
+            # Ignore the table re-selecting a row it re-rendered, so edits in
+            # the form survive scrolling
             return
-        row = self.tree.item(sel[0])["values"]
+        row = self._cached_row(sel[0])
         # id, date, category, amount, note
         self.date_var.set(row[1])
         self.category_var.set(row[2])
@@ -336,21 +720,15 @@ class ExpenseTrackerApp:
     # Filters & Export
     # -----------------------
     def apply_filter(self):
-        start = self.filter_start.get().strip() or None
-        end = self.filter_end.get().strip() or None
-        cat = self.filter_category.get().strip() or None
+        start, end, cat = (value or None for value in self._read_fields(self._filter_fields))
 
         # Validate dates (if provided)
         for d in (start, end):
-            if d:
-                try:
-                    datetime.datetime.strptime(d, "%Y-%m-%d")
-                except ValueError:
-                    messagebox.showerror("Invalid Date", "Use YYYY-MM-DD format for dates.")
-                    return
+            if d and not _valid_date(d):
+                messagebox.showerror("Invalid Date", "Use YYYY-MM-DD format for dates.")
+                return
 
-        rows = fetch_expenses(start, end, cat)
-        self.populate_table(rows)
+        self.populate_table(start, end, cat)
 
     def clear_filter(self):
         self.filter_start.set("")
@@ -359,52 +737,58 @@ class ExpenseTrackerApp:
         self.load_all_records()
 
     def export_csv(self):
-        # Export currently displayed rows
-        rows = [self.tree.item(r)["values"] for r in self.tree.get_children()]
-        if not rows:
+        # Export the rows matching the active filter, streamed straight from the DB
+        total = count_expenses(*self.current_filter)
+        if not total:
             messagebox.showinfo("No data", "No records to export.")
             return
         save_path = filedialog.asksaveasfilename(defaultextension=".csv",
                                                  filetypes=[("CSV files", "*.csv"), ("All files", "*.*")])
         if not save_path:
             return
-        with open(save_path, "w", newline="", encoding="utf-8") as f:
+        with open(save_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
             writer = csv.writer(f)
             writer.writerow(["id", "date", "category", "amount", "note"])
-            writer.writerows(rows)
-        messagebox.showinfo("Exported", f"Exported {len(rows)} records to {save_path}")
+            writer.writerows(iter_expenses(*self.current_filter))
+        messagebox.showinfo("Exported", f"Exported {total} records to {save_path}")
 
     # -----------------------
     # Summaries / Charts
     # -----------------------
     def show_monthly_summary(self):
-        rows = fetch_monthly_summary()
+        self._submit(fetch_monthly_summary, then=self._show_monthly_rows)
+
+    def _show_monthly_rows(self, rows):
         if not rows:
             messagebox.showinfo("No Data", "No records to summarize.")
             return
-        text = "Month\tTotal\n" + "\n".join(f"{r[0]}\t{float(r[1]):.2f}" for r in rows)
-        self._popup_text("Monthly Summary (YYYY-MM)", text)
+        lines = (f"{r[0]}\t{float(r[1]):.2f}\n" for r in rows)
+        self._popup_text_stream("Monthly Summary (YYYY-MM)", "Month\tTotal\n", lines)
 
     def show_category_summary(self):
-        start = self.filter_start.get().strip() or None
-        end = self.filter_end.get().strip() or None
-        rows = fetch_category_summary(start, end)
+        start, end, _ = (value or None for value in self._read_fields(self._filter_fields))
+        self._submit(fetch_category_summary, start, end, then=self._show_category_rows)
+
+    def _show_category_rows(self, rows):
         if not rows:
             messagebox.showinfo("No Data", "No records to summarize.")
             return
-        text = "Category\tTotal\n" + "\n".join(f"{r[0]}\t{float(r[1]):.2f}" for r in rows)
-        self._popup_text("Category Summary", text)
+        lines = (f"{r[0]}\t{float(r[1]):.2f}\n" for r in rows)
+        self._popup_text_stream("Category Summary", "Category\tTotal\n", lines)
 
     def plot_monthly_summary(self):
-        if not MATPLOTLIB_AVAILABLE:
-            messagebox.showerror("Missing", "Matplotlib is not available. Install it with:\n\npip install matplotlib")
+        if not self._load_matplotlib():
             return
-        rows = fetch_monthly_summary()
+        self._submit(fetch_monthly_summary, then=self._plot_monthly_rows)
+
+    def _plot_monthly_rows(self, rows):
         if not rows:
             messagebox.showinfo("No Data", "No records to plot.")
             return
+        plt, FigureCanvasTkAgg, np = self._mpl
+        # Oldest month first; totals go to Matplotlib as one float array
         months = [r[0] for r in reversed(rows)]
-        totals = [float(r[1]) for r in reversed(rows)]
+        totals = np.fromiter((float(r[1]) for r in rows), dtype=np.float64, count=len(rows))[::-1]
         # Create a simple bar chart in a new Tk window
         win = Toplevel(self.root)
         win.wm_title("Monthly Expense Chart")
@@ -419,6 +803,19 @@ class ExpenseTrackerApp:
         canvas.draw()
         canvas.get_tk_widget().pack(fill=BOTH, expand=True)
 
+    def _load_matplotlib(self):
+        # Matplotlib is slow to import, so only pay for it once a chart is wanted
+        if self._mpl is None:
+            try:
+                import matplotlib.pyplot as plt
+                from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+                import numpy as np
+            except ImportError:
+                messagebox.showerror("Missing", "Matplotlib is not available. Install it with:\n\npip install matplotlib")
+                return None
+            self._mpl = (plt, FigureCanvasTkAgg, np)
+        return self._mpl
+
     def quick_add_category(self):
         """Prompt for category and a single amount for quick add (today's date)."""
         cat = askstring("Quick Add", "Category name:")
@@ -432,17 +829,59 @@ class ExpenseTrackerApp:
         except ValueError:
             messagebox.showerror("Invalid", "Amount must be numeric.")
             return
-        insert_expense(datetime.date.today().isoformat(), cat.strip(), amt_val, "Quick add")
+        row = (datetime.date.today().isoformat(), cat.strip(), amt_val, "Quick add")
+        record_id = insert_expenses_bulk([row])
         messagebox.showinfo("Added", "Quick expense added.")
-        self.load_all_records()
+        self._row_added((record_id,) + row)
+
+    def _submit(self, func, *args, then):
+        """Run func(*args) on the DB worker and pass its result to then() on the Tk thread."""
+        future = self._exec.submit(func, *args)
+        future.add_done_callback(lambda fut: self._results.put((fut, then)))
+
+    def _poll_results(self):
+        # Reschedule first so an error in a handler cannot stop the polling
+        self.root.after(self.POLL_MS, self._poll_results)
+        while True:
+            try:
+                future, then = self._results.get_nowait()
+            except queue.Empty:
+                return
+            self._deliver(future, then)
+
+    def _deliver(self, future, then):
+        try:
+            result = future.result()
+        except sqlite3.Error as e:
+            messagebox.showerror("Database Error", str(e))
+            return
+        then(result)
+
+    def close(self):
+        # Let any queued query finish before the connection is closed
+        self._exec.shutdown(wait=True)
 
-    def _popup_text(self, title, text):
+    def _popup_text_stream(self, title, header, lines):
+        """Open the popup at once, then append lines in chunks between UI events."""
         win = Toplevel(self.root)
         win.wm_title(title)
         txt = Text(win, wrap="none", width=80, height=20)
-        txt.insert("1.0", text)
-        txt.configure(state=DISABLED)
         txt.pack(fill=BOTH, expand=True)
+        txt.insert(END, header)
+        chunks = _batched(lines, 512)
+
+        def feed():
+            if not txt.winfo_exists():
+                # Popup closed before the text finished loading
+                return
+            chunk = next(chunks, None)
+            if chunk is None:
+                txt.configure(state=DISABLED)
+                return
+            txt.insert(END, "".join(chunk))
+            win.after(1, feed)
+
+        feed()
 
 
 # ---------------------------
@@ -453,6 +892,8 @@ def main():
     root = Tk()
     app = ExpenseTrackerApp(root)
     root.mainloop()
+    app.close()
+    close_db()
 
 
 if __name__ == "__main__":